@@ -4,15 +4,23 @@
 rm -rf python
 mkdir -p python
 
-# 2. Install dependencies (Using quotes around pydantic[email] is safer)
-pip3 install \
-    --platform manylinux2014_aarch64 \
-    --target ./python \
-    --implementation cp \
-    --python-version 3.12 \
-    --only-binary=:all: \
-    --upgrade \
-    fastapi mangum "pydantic[email]" pytz httpx dnspython disposable-email-domains
+PIP_TARGET_ARGS=(
+    --platform manylinux2014_aarch64
+    --target ./python
+    --implementation cp
+    --python-version 3.12
+    --only-binary=:all:
+    --upgrade
+)
+
+# 2. Install dependencies
+pip3 install "${PIP_TARGET_ARGS[@]}" \
+    pydantic orjson anyio emval tzdata dnspython aioboto3 google-re2 jinja2
+
+# Install these without their optional extras (no h2, brotli, socksio, CLI)
+# and list only the transport they actually use: httpcore + h11
+pip3 install "${PIP_TARGET_ARGS[@]}" --no-deps \
+    httpx httpcore h11 certifi idna disposable-email-domains
 
 # 3. CLEANING (Safe way)
 # KEEP .dist-info folders for Pydantic!
@@ -21,6 +29,14 @@ find python -name "__pycache__" -type d -exec rm -rf {} +
 find python -name "tests" -type d -exec rm -rf {} +
 find python -name "docs" -type d -exec rm -rf {} +
 find python -name "*.pyc" -delete
+rm -rf python/bin
+
+# Timezone data: only America/New_York is used (zoneinfo needs the package __init__ files)
+find python/tzdata/zoneinfo -type f ! -name "__init__.py" ! -path "*/America/New_York" -delete
+find python/tzdata/zoneinfo -type d -empty -delete
+
+# botocore ships models for every AWS service, only SES is called
+find python/botocore/data -mindepth 1 -maxdepth 1 -type d ! -name "ses" -exec rm -rf {} +
 
 # 4. Zip it
-zip -r9 lambda-fastAPI-layer.zip python
+zip -r9 lambda-order-layer.zip python
@@ -1,27 +1,22 @@
 """
 AWS Lambda handler for processing orders
-Uses FastAPI with Mangum adapter and AWS SES for email
+Plain Lambda function URL handler with Pydantic validation and AWS SES for email
 """
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
-from mangum import Mangum
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, Field, ValidationError, model_validator, validator
+from emval import EmailValidator
 from typing import Dict
-import boto3
-import re
+import asyncio
+import base64
+import orjson
+import re2
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import uuid
 import os
-import httpx
-import dns.resolver
-from disposable_email_domains import blocklist
-
-app = FastAPI(root_path="/api",
-              docs_url=None,
-            redoc_url=None,
-            openapi_url=None)
+import time
 
+# Route served by this function (behind CloudFront)
+ORDER_PATH = '/api/order'
 
 # ============================================
 # BUSINESS EMAIL ENV
@@ -29,14 +24,149 @@ BUSINESS_EMAIL = os.getenv('BUSINESS_EMAIL')
 NO_REPLY_EMAIL = os.getenv('NO_REPLY_EMAIL')
 SUPPORT_EMAIL = os.getenv('SUPPORT_EMAIL')
 
+# Business hours timezone (stdlib zoneinfo, tz data from the tzdata package)
+EASTERN = ZoneInfo('America/New_York')
+SUNDAY = 6  # datetime.weekday() value
+# Business hours result for the current minute: (epoch_minute, is_valid, error_message)
+_BUSINESS_HOURS_CACHE = (-1, False, '')
+
 # CLOUDFLARE KEY
 CLOUDFLARE_KEY = os.getenv('CLOUDFLARE_KEY')
 
-# Initialize AWS SES client
-ses_client = boto3.client('ses', region_name='us-east-1')  # Change to your region
+# Email templates shipped alongside this file
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+# AWS SES client settings
+SES_REGION = 'us-east-1'  # Change to your region
+# Keep-alive pooled connections so warm invocations reuse the TLS session to SES
+SES_CLIENT_OPTIONS = dict(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={'max_attempts': 2, 'mode': 'standard'},
+    connect_timeout=2,
+    read_timeout=5
+)
+
+# Email syntax validator (Rust-backed). Deliverability is left to is_domain_real
+EMAIL_VALIDATOR = EmailValidator(deliverable_address=False)
+
+# Phone number validation pattern (RE2 engine, compiled once per container)
+PHONE_PATTERN = re2.compile(r'^(\+?1 *[ -.])?(\d{3}) *[ .-]?(\d{3}) *[ .-]?(\d{4}) *$')
+
+# Domain check results cached per Lambda container: domain -> (is_real, expires_at)
+DOMAIN_CACHE_TTL = 3600
+DOMAIN_CACHE_MAX_SIZE = 1024
+_DOMAIN_CACHE: dict[str, tuple[bool, float]] = {}
+
+# Failed Turnstile checks cached per Lambda container: (client_ip, token prefix) -> expires_at
+TURNSTILE_FAILURE_TTL = 60
+TURNSTILE_FAILURE_MAX_SIZE = 1024
+_TURNSTILE_FAILURES: dict[tuple[str, str], float] = {}
+
+# Major mail providers, known to accept mail so no DNS lookup is needed
+TRUSTED_EMAIL_DOMAINS = frozenset({
+    'gmail.com', 'googlemail.com', 'outlook.com', 'hotmail.com', 'live.com',
+    'msn.com', 'yahoo.com', 'ymail.com', 'rocketmail.com', 'aol.com',
+    'icloud.com', 'me.com', 'mac.com', 'protonmail.com', 'proton.me',
+    'pm.me', 'zoho.com', 'gmx.com', 'gmx.net', 'mail.com',
+    'yandex.com', 'fastmail.com', 'hey.com', 'tutanota.com', 'comcast.net',
+    'verizon.net', 'att.net', 'sbcglobal.net', 'bellsouth.net', 'cox.net',
+    'charter.net', 'earthlink.net', 'optonline.net', 'frontier.com', 'windstream.net',
+    'juno.com', 'netzero.net', 'hotmail.co.uk', 'yahoo.co.uk', 'outlook.co.uk',
+    'btinternet.com', 'sky.com', 'rogers.com', 'shaw.ca', 'sympatico.ca',
+    'yahoo.ca', 'hotmail.ca', 'live.ca', 'qq.com', '163.com',
+})
+
+# ============================================
+# LAZY-LOADED DEPENDENCIES
+# ============================================
+# Heavy imports are deferred to first use so cold starts only pay for what
+# the request actually needs (e.g. honeypot hits never load boto3, dns or httpx)
+
+_blocklist = None
+_dns_resolver = None
+_dns_missing_errors = ()  # (NoAnswer, NXDOMAIN), set by get_dns_resolver
+_http_client = None
+_ses_client = None
+_ses_is_async = False
+_email_templates = None
+
+
+def get_blocklist():
+    """Known disposable email domains, lowercased and frozen once"""
+    global _blocklist
+    if _blocklist is None:
+        from disposable_email_domains import blocklist
+        _blocklist = frozenset(domain.lower() for domain in blocklist)
+    return _blocklist
+
+
+def get_dns_resolver():
+    """Shared async DNS resolver, dnspython caches answers for their record TTL"""
+    global _dns_resolver, _dns_missing_errors
+    if _dns_resolver is None:
+        import dns.resolver
+        import dns.asyncresolver
+        _dns_missing_errors = (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN)
+        _dns_resolver = dns.asyncresolver.Resolver(configure=True)
+        _dns_resolver.lifetime = 2.0
+        _dns_resolver.cache = dns.resolver.LRUCache(1024)
+    return _dns_resolver
+
+
+def get_http_client():
+    """Shared HTTP client, keeps the connection to Cloudflare alive across warm invocations"""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        _http_client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4)
+        )
+    return _http_client
+
 
-# Phone number validation pattern
-PHONE_PATTERN = re.compile(r'^(\+?1 *[ -.])?(\d{3}) *[ .-]?(\d{3}) *[ .-]?(\d{4}) *$')
+def get_email_templates():
+    """
+    Compiled Jinja2 email templates (owner, customer), loaded once per container
+    """
+    global _email_templates
+    if _email_templates is None:
+        import jinja2
+        env = jinja2.Environment(
+            loader=jinja2.FunctionLoader(load_compact_template),
+            auto_reload=False,
+            autoescape=True,
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+        _email_templates = (env.get_template('owner.html'), env.get_template('customer.html'))
+    return _email_templates
+
+
+async def get_ses_client():
+    """
+    SES client, opened once and kept for the container's lifetime so its
+    connection pool survives across warm invocations.
+    Uses aioboto3 when available, otherwise the synchronous boto3 client
+    """
+    global _ses_client, _ses_is_async
+    if _ses_client is None:
+        try:
+            import aioboto3
+            from aiobotocore.config import AioConfig
+        except ImportError:  # Fall back to the synchronous SES client
+            import boto3
+            from botocore.config import Config
+            _ses_client = boto3.client(
+                'ses', region_name=SES_REGION, config=Config(**SES_CLIENT_OPTIONS)
+            )
+        else:
+            _ses_client = await aioboto3.Session().client(
+                'ses', region_name=SES_REGION, config=AioConfig(**SES_CLIENT_OPTIONS)
+            ).__aenter__()
+            _ses_is_async = True
+    return _ses_client
 
 # ============================================
 # PYDANTIC MODELS
@@ -56,36 +186,42 @@ class Cart(BaseModel):
     totalQty: int = Field(ge=0)
     totalPrice: float = Field(ge=0)
     
-    @validator('totalQty')
-    def validate_min_quantity(cls, v):
-        if v < 3:
-            raise ValueError("Our minimum order size for delivery is 3 items.")
-        return v
-    
-    @validator('totalPrice')
-    def validate_total_price(cls, v, values):
-        """Verify that totalPrice matches sum of item prices"""
-        if 'items' in values:
-            calculated_total = sum(item.price for item in values['items'].values())
-            # Allow small floating point differences
-            if abs(calculated_total - v) > 0.01:
-                raise ValueError("Total price does not match sum of item prices")
-        return v
-    
-    @validator('totalQty')
-    def validate_total_qty(cls, v, values):
-        """Verify that totalQty matches sum of item quantities"""
-        if 'items' in values:
-            calculated_qty = sum(item.qty for item in values['items'].values())
-            if calculated_qty != v:
-                raise ValueError("Total quantity does not match sum of item quantities")
-        return v
+    @model_validator(mode='after')
+    def validate_totals(self):
+        """Verify the minimum order size and that totals match the items, in one pass"""
+        calculated_qty = 0
+        calculated_total = 0.0
+        for item in self.items.values():
+            calculated_qty += item.qty
+            calculated_total += item.price
+        
+        # Collect every failure so they come back together, located on their field
+        errors = []
+        if self.totalQty < 3:
+            errors.append(('totalQty', "Our minimum order size for delivery is 3 items."))
+        elif calculated_qty != self.totalQty:
+            errors.append(('totalQty', "Total quantity does not match sum of item quantities"))
+        # Allow small floating point differences
+        if abs(calculated_total - self.totalPrice) > 0.01:
+            errors.append(('totalPrice', "Total price does not match sum of item prices"))
+        
+        if errors:
+            raise ValidationError.from_exception_data(self.__class__.__name__, [
+                {
+                    'type': 'value_error',
+                    'loc': (field,),
+                    'input': getattr(self, field),
+                    'ctx': {'error': ValueError(message)}
+                }
+                for field, message in errors
+            ])
+        return self
 
 
 class OrderRequest(BaseModel):
     """Request model for checkout"""
     phone: str
-    email: EmailStr
+    email: str
     verification: str  # honeypot field
     shipping: str
     order: Cart  # Now directly a Cart object, Pydantic handles parsing
@@ -96,6 +232,13 @@ class OrderRequest(BaseModel):
         if not PHONE_PATTERN.match(v):
             raise ValueError("Please enter a valid phone number.")
         return v
+    
+    @validator('email')
+    def validate_email_format(cls, v):
+        try:
+            return EMAIL_VALIDATOR.validate_email(v).normalized
+        except Exception:
+            raise ValueError("Please enter a valid email address.")
 
 
 # ============================================
@@ -107,218 +250,117 @@ def validate_business_hours() -> tuple[bool, str]:
     Check if current time is within business hours
     Returns: (is_valid, error_message)
     """
+    global _BUSINESS_HOURS_CACHE
+    
+    # Eastern offsets are whole hours, so open/closed can only change on a
+    # minute boundary and the result is reused for the rest of the minute
+    timestamp = time.time()
+    minute = int(timestamp) // 60
+    if _BUSINESS_HOURS_CACHE[0] == minute:
+        return _BUSINESS_HOURS_CACHE[1], _BUSINESS_HOURS_CACHE[2]
+    
     # Get current time in Eastern timezone
-    eastern = pytz.timezone('America/New_York')
-    now = datetime.now(eastern)
+    now = datetime.fromtimestamp(timestamp, EASTERN)
     
-    current_day = now.strftime('%A')  # Monday, Tuesday, etc.
     current_hour = now.hour
     
-    # Check if it's Sunday
-    if current_day == 'Sunday':
-        return False, 'Our business hours are Mon-Sat 8am-8pm.'
+    # Check if it's Sunday, or if hour is outside 8am-8pm (8-20 in 24hr format)
+    if now.weekday() == SUNDAY or current_hour < 8 or current_hour >= 20:
+        is_valid, error_message = False, 'Our business hours are Mon-Sat 8am-8pm.'
+    else:
+        is_valid, error_message = True, ''
     
-    # Check if hour is outside 8am-8pm (8-20 in 24hr format)
-    if current_hour < 8 or current_hour >= 20:
-        return False, 'Our business hours are Mon-Sat 8am-8pm.'
-    
-    return True, ''
+    _BUSINESS_HOURS_CACHE = (minute, is_valid, error_message)
+    return is_valid, error_message
 
 
 # ============================================
 # EMAIL TEMPLATE FUNCTIONS
 # ============================================
-def create_product_html(name: str, price: float, image_url: str, qty: int) -> str:
-    """Generate HTML for a single product using tables for stability"""
-    return f'''
-    <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="margin: 16px 0; border-bottom: 1px solid #e0e0e0;">
-        <tr>
-            <td style="width: 80px; padding-bottom: 16px; vertical-align: top;">
-                <img src="{image_url}" width="80" height="80" style="display: block; object-fit: contain; border-radius: 4px; border: 1px solid #f0f0f0;" alt="{name}">
-            </td>
-            
-            <td style="padding: 0 12px 16px 12px; vertical-align: top;">
-                <h4 style="margin: 0 0 4px 0; font-size: 16px; font-weight: 600; color: #333;">{name}</h4>
-                <p style="margin: 0; font-size: 14px; font-weight: 600; color: #2e7d32;">${price:.2f}</p>
-            </td>
-            
-            <td style="width: 60px; padding-bottom: 16px; vertical-align: top; text-align: right;">
-                <span style="font-size: 14px; color: #666; font-weight: bold;">Qty: {qty}</span>
-            </td>
-        </tr>
-    </table>
-    '''
-
-
-def create_order_html(products: list, total_qty: int, total_price: float, 
-                     email: str, phone: str, shipping: str, order_id: str) -> str:
-    """Generate complete HTML email template"""
-    products_html = ''.join(products)
-    
-    return f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>New Order</title>
-    </head>
-    <body style="margin: 0; padding: 20px; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; background-color: #f5f5f5;">
-        <div style="max-width: 600px; margin: 0 auto; background-color: #ffffff; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-            
-            <!-- Header -->
-            <div style="background-color: #2e7d32; padding: 30px 20px; text-align: center;">
-                <h2 style="margin: 0; font-size: 28px; color: #ffffff; font-weight: 600;">New Order Received</h2>
-                <p style="margin: 10px 0 0 0; color: #c8e6c9; font-size: 14px;">Order ID: {order_id}</p>
-            </div>
-            
-            <!-- Products Section -->
-            <div style="padding: 30px 20px;">
-                <h3 style="margin: 0 0 20px 0; font-size: 20px; color: #333; font-weight: 600;">Order Items</h3>
-                {products_html}
-            </div>
-            
-            <!-- Total Section -->
-            <div style="margin: 20px; padding: 24px; background-color: #f9f9f9; border-radius: 8px; border: 1px solid #e0e0e0;">
-                <div style="text-align: center; margin-bottom: 20px;">
-                    <p style="margin: 0 0 8px 0; font-size: 18px; color: #666;">{total_qty} Item{"s" if total_qty != 1 else ""}</p>
-                    <p style="margin: 0; font-size: 24px; font-weight: 700; color: #2e7d32;">Total: ${total_price:.2f}</p>
-                </div>
-                
-                <!-- Customer Details -->
-                <div style="padding-top: 20px; border-top: 1px solid #e0e0e0;">
-                    <h4 style="margin: 0 0 16px 0; font-size: 16px; color: #333; font-weight: 600;">Customer Information</h4>
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr>
-                            <td style="padding: 8px 0; font-weight: 600; color: #666; font-size: 14px; width: 100px;">Email:</td>
-                            <td style="padding: 8px 0; color: #333; font-size: 14px;">{email}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px 0; font-weight: 600; color: #666; font-size: 14px;">Phone:</td>
-                            <td style="padding: 8px 0; color: #333; font-size: 14px;">{phone}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px 0; font-weight: 600; color: #666; font-size: 14px;">Shipping:</td>
-                            <td style="padding: 8px 0; color: #333; font-size: 14px;">{shipping}</td>
-                        </tr>
-                    </table>
-                </div>
-            </div>
-            
-            <!-- Footer -->
-            <div style="padding: 20px; text-align: center; background-color: #fafafa; border-top: 1px solid #e0e0e0;">
-                <p style="margin: 0; color: #999; font-size: 12px;">This is an automated order notification</p>
-            </div>
-            
-        </div>
-    </body>
-    </html>
-    '''
-
-
-def create_customer_confirmation_html(products: list, total_qty: int, total_price: float, 
-                                     order_id: str) -> str:
-    """Generate customer confirmation email"""
-    products_html = ''.join(products)
-    
-    return f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Order Confirmation</title>
-    </head>
-    <body style="margin: 0; padding: 20px; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; background-color: #f5f5f5;">
-        <div style="max-width: 600px; margin: 0 auto; background-color: #ffffff; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-            
-            <!-- Header -->
-            <div style="background: linear-gradient(135deg, #2e7d32 0%, #43a047 100%); padding: 40px 20px; text-align: center;">
-                <h2 style="margin: 0; font-size: 28px; color: #ffffff; font-weight: 600;">Thank You for Your Order! 🎉</h2>
-                <p style="margin: 12px 0 0 0; color: #c8e6c9; font-size: 14px;">Order ID: {order_id}</p>
-            </div>
-            
-            <!-- Products Section -->
-            <div style="padding: 30px 20px;">
-                <h3 style="margin: 0 0 20px 0; font-size: 20px; color: #333; font-weight: 600; text-align: center;">Your Order Summary</h3>
-                {products_html}
-            </div>
-            
-            <!-- Total Section -->
-            <div style="margin: 20px; padding: 24px; background-color: #f9f9f9; border-radius: 8px; border: 2px solid #2e7d32; text-align: center;">
-                <p style="margin: 0 0 8px 0; font-size: 18px; color: #666;">{total_qty} Item{"s" if total_qty != 1 else ""}</p>
-                <p style="margin: 0; font-size: 28px; font-weight: 700; color: #2e7d32;">Total: ${total_price:.2f}</p>
-            </div>
-            
-            <!-- Confirmation Message -->
-            <div style="margin: 20px; padding: 24px; background: linear-gradient(135deg, #e8f5e9 0%, #c8e6c9 100%); border-radius: 8px; text-align: center;">
-                <p style="margin: 0; color: #1b5e20; font-weight: 600; font-size: 16px; line-height: 1.5;">
-                    We've received your order and will contact you soon to confirm delivery details!
-                </p>
-            </div>
-            
-            <!-- Footer -->
-            <div style="padding: 24px 20px; text-align: center; background-color: #fafafa; border-top: 1px solid #e0e0e0;">
-                <p style="margin: 0 0 8px 0; color: #666; font-size: 14px;">Questions about your order?</p>
-                <p style="margin: 0; color: #2e7d32; font-size: 14px; font-weight: 600;">Contact us at ${SUPPORT_EMAIL}</p>
-            </div>
-            
-        </div>
-    </body>
-    </html>
-    '''
+def compact_html(html: str) -> str:
+    """Strip indentation and blank lines so less HTML goes over the wire to SES"""
+    return '\n'.join(line.strip() for line in html.splitlines() if line.strip())
+
+
+def load_compact_template(name: str) -> str:
+    """Read a template source with its whitespace stripped, once at compile time"""
+    with open(os.path.join(TEMPLATES_DIR, name), encoding='utf-8') as f:
+        return compact_html(f.read())
 
 
 # ============================================
 # EMAIL SENDING FUNCTION
 # ============================================
 
-def is_domain_real(email):
-    try:
-        # Extract domain from email (e.g., "user@gmail.com" -> "gmail.com")
-        domain = email.split('@')[-1]
+def cache_domain_result(domain: str, is_real: bool) -> bool:
+    """Remember a domain check result and return it"""
+    if len(_DOMAIN_CACHE) >= DOMAIN_CACHE_MAX_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        _DOMAIN_CACHE.pop(next(iter(_DOMAIN_CACHE)))
+    _DOMAIN_CACHE[domain] = (is_real, time.monotonic() + DOMAIN_CACHE_TTL)
+    return is_real
 
-        
-        if domain in blocklist:
-            print(f"BLOCKLIST: Caught disposable email domain: {domain}")
-            return False
-
-        # Check for MX Records (The most important check for SES)
-        mx_records = dns.resolver.resolve(domain, 'MX')
-        if not mx_records:
-            return False
-            
-        #  Check for Nameservers (Optional "Strict" check)
-        ns_records = dns.resolver.resolve(domain, 'NS')
-        if not ns_records:
-            return False
 
+async def is_domain_real(email):
+    # Extract domain from email (e.g., "user@gmail.com" -> "gmail.com")
+    domain = email.rpartition('@')[2].lower()
+    
+    if domain in TRUSTED_EMAIL_DOMAINS:
         return True
-    except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, Exception):
+    
+    if domain in get_blocklist():
+        print(f"BLOCKLIST: Caught disposable email domain: {domain}")
+        return False
+    
+    cached = _DOMAIN_CACHE.get(domain)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+    
+    resolver = get_dns_resolver()
+    
+    try:
+        # Check for MX Records (The only signal SES cares about).
+        # No separate NS check: a missing zone already raises NXDOMAIN here
+        mx_records = await resolver.resolve(domain, 'MX')
+        return cache_domain_result(domain, bool(mx_records))
+    except _dns_missing_errors:
         # NXDOMAIN means the domain doesn't even exist
+        return cache_domain_result(domain, False)
+    except Exception:
+        # Timeouts and other transient failures are not cached
         return False
 
 
+async def send_ses_emails(messages: list) -> list:
+    """
+    Send SES messages concurrently
+    Returns: the SES response or the raised exception for each message
+    """
+    client = await get_ses_client()
+    if _ses_is_async:
+        return await asyncio.gather(
+            *(client.send_email(**message) for message in messages),
+            return_exceptions=True
+        )
+    
+    # Synchronous fallback: run the blocking calls in worker threads
+    return await asyncio.gather(
+        *(asyncio.to_thread(client.send_email, **message) for message in messages),
+        return_exceptions=True
+    )
+
+
 async def send_order_emails(order_data: OrderRequest, order_id: str) -> bool:
     """
     Send order confirmation emails via AWS SES
-    Returns: True if successful, False otherwise
+    Returns: True if the business owner was notified, False otherwise
     """
     try:
-        # Build product HTML list
-        product_html_list = []
-        for item_name, item_data in order_data.order.items.items():
-            product_html = create_product_html(
-                name=item_name,
-                price=item_data.price,
-                image_url=item_data.imageUrl,
-                qty=item_data.qty
-            )
-            product_html_list.append(product_html)
+        owner_template, customer_template = get_email_templates()
         
         # Create email HTML for business owner
-        owner_email_html = create_order_html(
-            products=product_html_list,
+        owner_email_html = owner_template.render(
+            items=order_data.order.items,
             total_qty=order_data.order.totalQty,
             total_price=order_data.order.totalPrice,
             email=order_data.email,
@@ -328,15 +370,16 @@ async def send_order_emails(order_data: OrderRequest, order_id: str) -> bool:
         )
         
         # Create email HTML for customer
-        customer_email_html = create_customer_confirmation_html(
-            products=product_html_list,
+        customer_email_html = customer_template.render(
+            items=order_data.order.items,
             total_qty=order_data.order.totalQty,
             total_price=order_data.order.totalPrice,
+            support_email=SUPPORT_EMAIL,
             order_id=order_id
         )
         
-        # Send email to business owner
-        ses_client.send_email(
+        # Email to business owner
+        owner_message = dict(
             Source=NO_REPLY_EMAIL,  # Must be verified in SES
             Destination={
                 'ToAddresses': [BUSINESS_EMAIL]  # Your business email
@@ -355,8 +398,8 @@ async def send_order_emails(order_data: OrderRequest, order_id: str) -> bool:
             }
         )
         
-        # Send confirmation email to customer
-        ses_client.send_email(
+        # Confirmation email to customer
+        customer_message = dict(
             Source=NO_REPLY_EMAIL,  # Must be verified in SES
             Destination={
                 'ToAddresses': [order_data.email.lower()]
@@ -375,6 +418,20 @@ async def send_order_emails(order_data: OrderRequest, order_id: str) -> bool:
             }
         )
         
+        # Send both emails concurrently, checking each result on its own
+        owner_result, customer_result = await send_ses_emails([owner_message, customer_message])
+        
+        # The customer email is a courtesy: once the business has the order it
+        # is placed, and failing here would make the customer retry and send
+        # the owner a duplicate order
+        if isinstance(customer_result, Exception):
+            print(f"Error sending customer email for order {order_id}: {str(customer_result)}")
+        
+        # The owner email is what gets the order fulfilled, so it decides success
+        if isinstance(owner_result, Exception):
+            print(f"Error sending owner email for order {order_id}: {str(owner_result)}")
+            return False
+        
         return True
         
     except Exception as e:
@@ -384,61 +441,112 @@ async def send_order_emails(order_data: OrderRequest, order_id: str) -> bool:
 # ============================================
 # CLOUDFLARE VALIDATION
 # ============================================
+def turnstile_failure_key(client_ip: str, token: str) -> tuple[str, str]:
+    """Cache key for a Turnstile check: client IP and token prefix"""
+    return (client_ip, token[:16])
+
+
+def is_known_turnstile_failure(key: tuple[str, str]) -> bool:
+    """Check if this client/token already failed Turnstile within the TTL"""
+    expires_at = _TURNSTILE_FAILURES.get(key)
+    return expires_at is not None and expires_at > time.monotonic()
+
+
+def remember_turnstile_failure(key: tuple[str, str]):
+    """Cache a failed Turnstile check so repeats are rejected without calling Cloudflare"""
+    now = time.monotonic()
+    if len(_TURNSTILE_FAILURES) >= TURNSTILE_FAILURE_MAX_SIZE:
+        # Prune expired entries, then evict the oldest if still full
+        for expired in [k for k, expires_at in _TURNSTILE_FAILURES.items() if expires_at <= now]:
+            del _TURNSTILE_FAILURES[expired]
+        if len(_TURNSTILE_FAILURES) >= TURNSTILE_FAILURE_MAX_SIZE:
+            _TURNSTILE_FAILURES.pop(next(iter(_TURNSTILE_FAILURES)))
+    _TURNSTILE_FAILURES[key] = now + TURNSTILE_FAILURE_TTL
+
+
 async def verify_turnstile_token(token: str):
     url = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
     
-    # Use an async client
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, data={
-            "secret": CLOUDFLARE_KEY,
-            "response": token,
-        })
-        
-        result = response.json()
-        return result.get("success", False)
+    # Reuse the module-level client instead of a new TLS handshake per request
+    response = await get_http_client().post(url, data={
+        "secret": CLOUDFLARE_KEY,
+        "response": token,
+    })
+    
+    result = orjson.loads(response.content)
+    return result.get("success", False)
+
+
+
+# ============================================
+# HTTP RESPONSES
+# ============================================
+
+class HTTPException(Exception):
+    """Error returned to the client as {"detail": ...} with an HTTP status code"""
+    
+    def __init__(self, status_code: int, detail):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
 
+def json_response(status_code: int, content) -> dict:
+    """Build a Lambda function URL response with a JSON body"""
+    return {
+        'statusCode': status_code,
+        'headers': {'Content-Type': 'application/json'},
+        'body': orjson.dumps(content).decode()
+    }
 
 
 # ============================================
 # API ENDPOINTS
 # ============================================
 
-@app.post("/order")
-async def process_order(order_request: OrderRequest,request: Request):
+def generate_order_id() -> str:
+    """Generate unique order ID"""
+    return str(uuid.uuid4())[:8].upper()
+
+
+async def process_order(order_request: OrderRequest, client_ip: str) -> dict:
     """
     Process order submission
     Validates data, sends emails, and returns order ID
     """
     
     try:
-        client_ip = request.client.host
         # Validate business hours
         is_valid_hours, hours_error = validate_business_hours()
         if not is_valid_hours:
             raise HTTPException(status_code=400, detail=hours_error)
         
-        # Generate unique order ID
-        order_id = str(uuid.uuid4())[:8].upper()
+        order_id = generate_order_id()
         
-        # Check Honeypot field verification
-        if order_request.verification:
-            print(f"HONEYPOT TRIGGERED: Bot at {client_ip} sent '{order_request.verification}'")
-            return JSONResponse(
-            status_code=200,
-            content={
-                "success": True,
-                "orderId": order_id,
-                "message": "Order placed successfully"
-            }
-        )
-        # Now you can use 'await' properly
-        is_human = await verify_turnstile_token(order_request.cf_token)
+        # Repeat of a recently failed Turnstile check, reject without calling Cloudflare
+        turnstile_key = turnstile_failure_key(client_ip, order_request.cf_token)
+        if is_known_turnstile_failure(turnstile_key):
+            raise HTTPException(status_code=400, detail="Security check failed")
+        
+        # Turnstile verification and the mail exchange check are independent,
+        # so run them concurrently (SES will check the final email)
+        turnstile_task = asyncio.create_task(verify_turnstile_token(order_request.cf_token))
+        domain_task = asyncio.create_task(is_domain_real(order_request.email.lower()))
+        try:
+            is_human, is_domain_ok = await asyncio.gather(turnstile_task, domain_task)
+        finally:
+            # If one check raised, cancel the other and let it finish here,
+            # so nothing stays pending on the container's shared loop
+            pending = [task for task in (turnstile_task, domain_task) if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
         
         if not is_human:
+            remember_turnstile_failure(turnstile_key)
             raise HTTPException(status_code=400, detail="Security check failed")
         
-        # Name server and Mail ecahnge check and SES will check the final email
-        if not is_domain_real(order_request.email.lower()):
+        if not is_domain_ok:
             print(f"SECURITY: Blocked invalid email domain: {order_request.email}")
             raise HTTPException(status_code=400, detail="Please provide a valid email address.")
         
@@ -456,14 +564,11 @@ async def process_order(order_request: OrderRequest,request: Request):
         
         # Return success with order ID
         # Frontend will use this to redirect to success page
-        return JSONResponse(
-            status_code=200,
-            content={
-                "success": True,
-                "orderId": order_id,
-                "message": "Order placed successfully"
-            }
-        )
+        return json_response(200, {
+            "success": True,
+            "orderId": order_id,
+            "message": "Order placed successfully"
+        })
         
     except HTTPException:
         raise
@@ -475,9 +580,107 @@ async def process_order(order_request: OrderRequest,request: Request):
         )
 
 
+# ============================================
+# SNAPSTART
+# ============================================
+
+try:
+    from snapshot_restore_py import register_before_snapshot
+except ImportError:  # Not running on a SnapStart-enabled Lambda runtime
+    register_before_snapshot = None
+
+
+def warm_dependencies():
+    """
+    Load the lazy dependencies before the SnapStart snapshot is taken so
+    restored containers start with them imported and compiled.
+    No network calls are made here, connections would be stale after restore
+    """
+    get_blocklist()
+    get_dns_resolver()
+    get_http_client()
+    get_email_templates()
+    try:
+        import aioboto3  # noqa: F401
+    except ImportError:
+        import boto3  # noqa: F401
+
+
+if register_before_snapshot is not None:
+    register_before_snapshot(warm_dependencies)
+
+
 # ============================================
 # LAMBDA HANDLER
 # ============================================
 
-# Mangum adapter for AWS Lambda
-lambda_handler = Mangum(app)
+def get_client_ip(event: dict) -> str:
+    """
+    Viewer IP for a request coming through CloudFront.
+    requestContext.http.sourceIp is the CloudFront edge, so prefer the
+    CloudFront-Viewer-Address header ("ip:port", forwarded by the origin request
+    policy), then the first X-Forwarded-For entry, then sourceIp
+    """
+    headers = event.get('headers') or {}
+    
+    viewer_address = headers.get('cloudfront-viewer-address')
+    if viewer_address:
+        return viewer_address.rpartition(':')[0]
+    
+    # Client-supplied, so only trusted for logging and the Turnstile cache
+    forwarded_for = headers.get('x-forwarded-for')
+    if forwarded_for:
+        return forwarded_for.partition(',')[0].strip()
+    
+    return event.get('requestContext', {}).get('http', {}).get('sourceIp')
+
+
+# One event loop per container, so pooled clients (httpx, aioboto3) stay bound to it
+_LOOP = asyncio.new_event_loop()
+asyncio.set_event_loop(_LOOP)
+
+
+def lambda_handler(event, context):
+    """
+    Lambda function URL entry point for POST /api/order
+    Parses the body, answers honeypot hits straight away, validates the rest
+    and runs process_order on the container's loop.
+    Error bodies keep the {"detail": ...} shape the frontend reads
+    """
+    http = event.get('requestContext', {}).get('http', {})
+    if event.get('rawPath') != ORDER_PATH:
+        return json_response(404, {'detail': 'Not Found'})
+    if http.get('method') != 'POST':
+        return json_response(405, {'detail': 'Method Not Allowed'})
+    
+    client_ip = get_client_ip(event)
+    body = event.get('body') or ''
+    if event.get('isBase64Encoded'):
+        body = base64.b64decode(body)
+    
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return json_response(422, {'detail': [{'msg': 'JSON decode error'}]})
+    
+    # Check Honeypot field verification before any model validation,
+    # so bot traffic gets its fake success without paying for it
+    if isinstance(payload, dict) and payload.get('verification'):
+        print(f"HONEYPOT TRIGGERED: Bot at {client_ip} sent '{payload['verification']}'")
+        return json_response(200, {
+            "success": True,
+            "orderId": generate_order_id(),
+            "message": "Order placed successfully"
+        })
+    
+    try:
+        order_request = OrderRequest.model_validate(payload)
+    except ValidationError as e:
+        return json_response(422, {
+            'detail': e.errors(include_url=False, include_context=False, include_input=False)
+        })
+    
+    try:
+        return _LOOP.run_until_complete(process_order(order_request, client_ip))
+    except HTTPException as e:
+        return json_response(e.status_code, {'detail': e.detail})